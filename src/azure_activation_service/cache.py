@@ -0,0 +1,150 @@
+import atexit
+import functools
+import gzip
+import os
+import tempfile
+import threading
+import time
+import zlib
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+import click
+import msgpack
+
+from .config import ROLES_CACHE_FILE, LEGACY_ROLES_CACHE_FILES, ROLES_CACHE_SOFT_TTL, ensure_config_dir
+
+# The PIM client pulls in azure-identity, so it is only imported when needed
+if TYPE_CHECKING:
+    from .pim_client import PIMClient
+
+# Buffer size for roles cache file I/O
+CACHE_IO_BUFFER_SIZE = 64 * 1024
+
+# Seconds to wait at exit for a background cache refresh to finish
+REVALIDATE_JOIN_TIMEOUT = 10
+
+
+@functools.lru_cache(maxsize=1)
+def get_pim_client() -> 'PIMClient':
+    """Get the PIM client shared by all commands run in this process"""
+    from .pim_client import PIMClient
+    return PIMClient()
+
+
+def load_roles_from_cache(pim: 'PIMClient', ttl: int = ROLES_CACHE_SOFT_TTL,
+                          max_stale: Optional[int] = None) -> Optional[List]:
+    """Load roles from cache file if available and not older than the TTL.
+
+    The TTL only applies to this read and is never persisted. If max_stale is
+    given, roles older than the TTL but younger than max_stale are still
+    returned while the cache is refreshed in the background.
+    """
+    click.echo("Loading roles from cache...")
+    cache_data = read_cache()
+    if cache_data is not None:
+        try:
+            age = time.time() - cache_data['fetched_at']
+            if age > ttl:
+                if max_stale is None or age > max_stale:
+                    click.echo("Cached roles are stale.")
+                    return None
+                revalidate_cache_in_background(pim)
+            return pim.deserialize_roles(cache_data['roles'])
+        except (ValueError, KeyError, TypeError):
+            return None
+    return None
+
+
+def read_cache() -> Optional[dict]:
+    """Read the raw cache data, or None if the cache is missing or corrupt"""
+    if ROLES_CACHE_FILE.exists():
+        try:
+            with open(ROLES_CACHE_FILE, 'rb', buffering=CACHE_IO_BUFFER_SIZE) as f:
+                cache_data = msgpack.unpackb(gzip.decompress(f.read()), raw=False)
+            if isinstance(cache_data, dict):
+                return cache_data
+        except (gzip.BadGzipFile, EOFError, zlib.error, msgpack.UnpackException, ValueError):
+            return None
+    return None
+
+
+def refresh_and_save_cache(pim: 'PIMClient') -> List:
+    """Fetch fresh roles and update cache"""
+    click.echo("Fetching roles from Azure PIM...")
+    fetched_at = time.time()
+    roles = pim.get_roles()
+    save_roles_to_cache(pim, roles, fetched_at)
+    click.echo("Roles cached successfully.")
+    return roles
+
+
+def revalidate_cache_in_background(pim: 'PIMClient'):
+    """Refresh the cache in a background thread that is joined before exit"""
+    def revalidate():
+        try:
+            fetched_at = time.time()
+            save_roles_to_cache(pim, pim.get_roles(), fetched_at)
+        except Exception:
+            pass  # Best effort, keep the stale cache and retry next invocation
+
+    thread = threading.Thread(target=revalidate, daemon=True)
+    thread.start()
+    # Don't hang at exit if the network stalls, the roles are already shown
+    atexit.register(thread.join, REVALIDATE_JOIN_TIMEOUT)
+
+
+def save_roles_to_cache(pim: 'PIMClient', roles: List, fetched_at: Optional[float] = None):
+    """Write roles to the cache file, e.g. after updating them in place.
+
+    Pass fetched_at only when the roles were just fetched from Azure. For
+    in-place updates it is kept from the existing cache, so updating a single
+    role does not extend the freshness of all the others.
+    """
+    if fetched_at is None:
+        previous = read_cache() or {}
+        fetched_at = previous.get('fetched_at', 0)
+    cache_data = {
+        "fetched_at": fetched_at,
+        "roles": pim.serialize_roles(roles)
+    }
+    # Level 1 compression is nearly free and the role data is highly repetitive
+    data = gzip.compress(msgpack.packb(cache_data, use_bin_type=True), compresslevel=1)
+    # Write to a temporary file and rename it over the cache so an interrupted
+    # write never leaves a truncated cache behind
+    ensure_config_dir()
+    fd, tmp_path = tempfile.mkstemp(
+        dir=ROLES_CACHE_FILE.parent, prefix=ROLES_CACHE_FILE.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb', buffering=CACHE_IO_BUFFER_SIZE) as f:
+            f.write(data)
+        os.replace(tmp_path, ROLES_CACHE_FILE)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    for legacy_file in LEGACY_ROLES_CACHE_FILES:
+        try:
+            legacy_file.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def update_cache_in_place(pim: 'PIMClient', roles: List, update: Callable[[], None]):
+    """Apply update to the loaded roles and write them back to the cache.
+
+    This runs after a command has already succeeded, so it is best effort:
+    if the update fails the cache is invalidated to force a refetch instead.
+    """
+    try:
+        update()
+        save_roles_to_cache(pim, roles)
+    except Exception:
+        invalidate_cache()
+
+
+def invalidate_cache():
+    """Remove the cache file so the next command fetches roles again"""
+    try:
+        ROLES_CACHE_FILE.unlink()
+    except FileNotFoundError:
+        pass
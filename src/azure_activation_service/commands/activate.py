@@ -0,0 +1,41 @@
+import click
+
+from ..cache import get_pim_client, load_roles_from_cache, refresh_and_save_cache, update_cache_in_place
+
+
+@click.command()
+@click.argument('role-id')
+@click.option('--justification', '-j', default="CLI activation request", help='Justification for role activation')
+def activate(role_id: str, justification: str):
+    """Activate an Azure role by its ID"""
+    from ..pim_client import NotAuthenticatedError, PIMError
+
+    try:
+        pim = get_pim_client()
+        # Try to load from cache first
+        roles = load_roles_from_cache(pim) or refresh_and_save_cache(pim)
+
+        # Find role by ID
+        role = pim.index_roles(roles).get(role_id)
+        if not role:
+            click.echo(f"Error: Role with ID {role_id} not found.", err=True)
+            return
+
+        if role.assignment_type:
+            click.echo(
+                f"Role '{role.display_name}' is already activated.", err=True)
+            return
+
+        result = pim.activate_role(role, justification)
+        click.echo(
+            f"Successfully activated role: {role.display_name} - {role.resource_name}")
+
+        # Update the cached role in place instead of refetching all roles
+        update_cache_in_place(
+            pim, roles, lambda: pim.apply_activation(role, result))
+
+    except NotAuthenticatedError:
+        click.echo(
+            "Error: Not authenticated with Azure. Please run 'az login' first.", err=True)
+    except PIMError as e:
+        click.echo(f"Error: {str(e)}", err=True)
@@ -0,0 +1,99 @@
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import click
+
+from ..cache import get_pim_client, refresh_and_save_cache, update_cache_in_place
+from ..config import AUTO_ACTIVATE_CONFIG
+
+# Maximum number of concurrent activation requests in auto-activate
+AUTO_ACTIVATE_MAX_WORKERS = 8
+
+
+@click.command(name='auto-activate')
+def auto_activate():
+    """Automatically activate roles marked for auto-activation in the config"""
+    from ..pim_client import NotAuthenticatedError
+
+    try:
+        # Load auto-activate config
+        if not AUTO_ACTIVATE_CONFIG.exists():
+            click.echo(
+                "No auto-activate configuration found. Use 'import-config' to set up auto-activation.", err=True)
+            return
+
+        with open(AUTO_ACTIVATE_CONFIG, 'r') as f:
+            config_data = json.load(f)
+
+        if not config_data.get('roles'):
+            click.echo("No roles configured for auto-activation.", err=True)
+            return
+
+        pim = get_pim_client()
+        roles = refresh_and_save_cache(pim)  # force update of cache
+        roles_by_id = pim.index_roles(roles)
+
+        activated_count = 0
+        skipped_count = 0
+        failed_count = 0
+        roles_to_activate = []
+        activation_results = []
+
+        for config_role in config_data['roles']:
+            if not config_role.get('autoActivate'):
+                continue
+
+            role = roles_by_id.get(config_role['id'])
+            if not role:
+                click.echo(
+                    f"Warning: Configured role {config_role['name']} not found in available roles", err=True)
+                failed_count += 1
+                continue
+
+            if role.assignment_type:
+                click.echo(
+                    f"Skipping {role.display_name} {role.resource_name} - already activated")
+                skipped_count += 1
+                continue
+
+            roles_to_activate.append(role)
+
+        # Activations are independent requests, so send them concurrently
+        with ThreadPoolExecutor(max_workers=AUTO_ACTIVATE_MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(pim.activate_role, role, "Automatic activation via CLI"): role
+                for role in roles_to_activate
+            }
+            for future in as_completed(futures):
+                role = futures[future]
+                try:
+                    activation_results.append((role, future.result()))
+                    click.echo(
+                        f"Activated {role.display_name} {role.resource_name}")
+                    activated_count += 1
+                except Exception as e:
+                    # Report every request, so one failure doesn't hide the others
+                    click.echo(
+                        f"Failed to activate {role.display_name} {role.resource_name}: {str(e)}", err=True)
+                    failed_count += 1
+
+        # Update the cache with the activated roles instead of refetching them
+        if activation_results:
+            def apply_activations():
+                for role, result in activation_results:
+                    pim.apply_activation(role, result)
+
+            update_cache_in_place(pim, roles, apply_activations)
+
+        click.echo(f"\nAuto-activation complete:")
+        click.echo(f"  Activated: {activated_count}")
+        click.echo(f"  Skipped (already active): {skipped_count}")
+        click.echo(f"  Failed: {failed_count}")
+
+    except NotAuthenticatedError:
+        click.echo(
+            "Error: Not authenticated with Azure. Please run 'az login' first.", err=True)
+    except json.JSONDecodeError:
+        click.echo("Error: Invalid auto-activate configuration file", err=True)
+    except Exception as e:
+        click.echo(f"Error: {str(e)}", err=True)
@@ -0,0 +1,61 @@
+import os
+import sys
+from pathlib import Path
+
+import click
+
+
+def get_entry_point():
+    """Get the entry point name in different contexts."""
+    
+    # First try sys.argv[0]
+    if sys.argv[0]:
+        return os.path.abspath(sys.argv[0])
+
+
+@click.command(name='generate-service')
+@click.option('--interval', '-i', default=5, help='Auto-activation check interval in minutes')
+@click.option('--name', '-n', default='azure-pim-activator', help='Name for the systemd service')
+def generate_service(interval: int, name: str):
+    """Generate a systemd user service file for automatic role activation"""
+    service_entrypoint = get_entry_point()
+    # Sanitize service name and ensure it ends with .service
+    service_name = name.replace(' ', '-').lower()
+    if not service_name.endswith('.service'):
+        service_name += '.service'
+
+    service_content = f"""[Unit]
+Description=Azure PIM Role Auto-Activator
+After=network-online.target
+Wants=network-online.target
+
+[Service]
+Type=simple
+Environment=PATH=/usr/local/bin:/usr/bin:/bin
+Environment=AZURE_CONFIG_DIR={os.environ.get('AZURE_CONFIG_DIR', '')}
+ExecStart={service_entrypoint} service --interval {interval}
+Restart=always
+RestartSec=10
+
+[Install]
+WantedBy=default.target
+"""
+
+    # Create service file in user's systemd directory
+    service_dir = Path.home() / ".config/systemd/user"
+    service_dir.mkdir(parents=True, exist_ok=True)
+    output_file = service_dir / service_name
+
+    with open(output_file, "w") as f:
+        f.write(service_content)
+
+    service_name_without_ext = service_name.removesuffix('.service')
+    click.echo(f"User service file generated at: {output_file}")
+    click.echo("\nTo manage the service:")
+    click.echo(f"1. Enable and start the service:")
+    click.echo(f"   systemctl --user enable {service_name_without_ext}")
+    click.echo(f"   systemctl --user start {service_name_without_ext}")
+    click.echo("\nTo check service status:")
+    click.echo(f"   systemctl --user status {service_name_without_ext}")
+    click.echo("\nTo enable auto-start on login:")
+    click.echo("   loginctl enable-linger $USER")
@@ -0,0 +1,65 @@
+import json
+
+import click
+
+from ..cache import get_pim_client, load_roles_from_cache, refresh_and_save_cache
+from ..config import DEFAULT_IMPORT_CONFIG_FILE, AUTO_ACTIVATE_CONFIG, ensure_config_dir
+from ..formatting import echo_table
+
+
+@click.command(name='import-config')
+@click.argument('config_file', type=click.Path(exists=True), required=False, default=DEFAULT_IMPORT_CONFIG_FILE)
+@click.option('--format', 'table_format', type=click.Choice(['plain', 'grid']), default='plain', show_default=True, help='Table output format')
+def import_config(config_file, table_format: str):
+    """Import role configuration from JSON file. If no file is specified, uses the default config file."""
+    try:
+        with open(config_file, 'r') as f:
+            config_data = json.load(f)
+
+        # Validate config structure before fetching any roles
+        if "roles" not in config_data and "autoActivationEnabled" not in config_data:
+            raise click.ClickException(
+                "Invalid config file format. Must contain 'roles' list.")
+
+        # Convert old format to new format if needed
+        if "autoActivationEnabled" in config_data:
+            old_config = config_data["autoActivationEnabled"]
+            pim = get_pim_client()
+            roles = load_roles_from_cache(pim) or refresh_and_save_cache(pim)
+
+            new_config = {"roles": []}
+            for role in roles:
+                auto_activate = old_config.get(role.name, False)
+                new_config["roles"].append({
+                    "id": role.name,
+                    "name": role.display_name,
+                    "resource": role.resource_name,
+                    "autoActivate": auto_activate
+                })
+            config_data = new_config
+
+        # Save the config
+        ensure_config_dir()
+        with open(AUTO_ACTIVATE_CONFIG, 'w') as f:
+            json.dump(config_data, f, indent=4)
+
+        click.echo(
+            f"Successfully imported configuration for {len(config_data['roles'])} roles")
+
+        # Display the imported configuration
+        table_data = [
+            [r["name"], r["resource"], "Yes" if r["autoActivate"] else "No"]
+            for r in config_data["roles"]
+        ]
+        headers = ["Role Name", "Resource", "Auto-Activate"]
+        click.echo("\nImported Configuration:")
+        echo_table(table_data, headers, table_format)
+        click.echo(
+            "\nTo activate roles marked for auto-activation, run 'auto-activate' command.")
+        click.echo("You can also edit the configuration file directly at: " +
+                   str(AUTO_ACTIVATE_CONFIG))
+
+    except json.JSONDecodeError:
+        click.echo("Error: Invalid JSON file", err=True)
+    except Exception as e:
+        click.echo(f"Error: {str(e)}", err=True)
@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+
+import click
+
+from ..cache import get_pim_client, load_roles_from_cache, refresh_and_save_cache
+from ..config import ROLES_CACHE_SOFT_TTL, ROLES_CACHE_HARD_TTL
+from ..formatting import calculate_expiry, echo_table
+
+
+@click.command(name='list-roles')
+@click.option('--verbose', '-v', is_flag=True, help='Show additional role details')
+@click.option('--update', '-u', is_flag=True, help='Force update of cached roles')
+@click.option('--ttl', default=ROLES_CACHE_SOFT_TTL, show_default=True, help='Age in seconds after which cached roles are refreshed')
+@click.option('--format', 'table_format', type=click.Choice(['plain', 'grid']), default='plain', show_default=True, help='Table output format')
+def list_roles(verbose: bool, update: bool, ttl: int, table_format: str):
+    """List all available Azure PIM roles"""
+    from ..pim_client import NotAuthenticatedError, PIMError
+
+    try:
+        pim = get_pim_client()
+
+        # Load roles based on update flag and cache freshness, serving
+        # stale roles while they are refreshed in the background
+        roles = None if update else load_roles_from_cache(
+            pim, ttl, max_stale=ROLES_CACHE_HARD_TTL)
+        if roles is None:
+            roles = refresh_and_save_cache(pim)
+
+        if not roles:
+            click.echo("No PIM roles found.")
+            return
+
+        # Prepare table data, computing status and expiry once per role
+        now = datetime.now(timezone.utc)
+        headers = ["Role Name", "Resource",
+                   "Type", "Status", "Expiry", "Role ID"]
+        table_data = [
+            (
+                role.display_name,
+                role.resource_name,
+                role.resource_type,
+                "ACTIVATED" if role.assignment_type else "NOT ACTIVATED",
+                calculate_expiry(role.end_date_time, now),
+                role.name
+            )
+            for role in roles
+        ]
+        if not verbose:
+            headers = [headers[0], headers[1], headers[3], headers[4]]
+            table_data = [(row[0], row[1], row[3], row[4])
+                          for row in table_data]
+
+        # Print table
+        echo_table(table_data, headers, table_format)
+
+    except NotAuthenticatedError:
+        click.echo(
+            "Error: Not authenticated with Azure. Please run 'az login' first.", err=True)
+    except PIMError as e:
+        click.echo(f"Error: {str(e)}", err=True)
@@ -0,0 +1,46 @@
+import asyncio
+import signal
+import sys
+from datetime import datetime
+
+import click
+
+from .auto_activate import auto_activate
+
+
+async def auto_activate_loop(interval_minutes: int):
+    """Run auto-activate in a loop with the specified interval"""
+    click.echo(
+        f"Starting auto-activation service, checking every {interval_minutes} minutes")
+
+    async def signal_handler():
+        click.echo("\nShutdown signal received, cleaning up...")
+        sys.exit(0)
+
+    # Setup signal handlers
+    loop = asyncio.get_event_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(
+            sig, lambda: asyncio.create_task(signal_handler()))
+
+    while True:
+        try:
+            click.echo(
+                f"\n[{datetime.now().isoformat()}] Running auto-activation check...")
+            # Call the existing auto_activate logic
+            auto_activate.callback()
+
+            click.echo(f"Next check in {interval_minutes} minutes")
+            await asyncio.sleep(interval_minutes * 60)
+
+        except Exception as e:
+            click.echo(f"Error during auto-activation: {str(e)}", err=True)
+            click.echo(f"Retrying in {interval_minutes} minutes")
+            await asyncio.sleep(interval_minutes * 60)
+
+
+@click.command(name='service')
+@click.option('--interval', '-i', default=5, help='Auto-activation check interval in minutes')
+def service(interval: int):
+    """Run as a service, continuously checking for roles to activate"""
+    asyncio.run(auto_activate_loop(interval))
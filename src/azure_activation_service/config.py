@@ -6,11 +6,20 @@ azure_config = Path(os.getenv('AZURE_CONFIG_DIR', str(Path.home() / '.azure')))
 CONFIG_DIR = azure_config.parent / '.azure_activation_service'
 
 # Cache file paths
-ROLES_CACHE_FILE = CONFIG_DIR / 'roles_cache.json'
+ROLES_CACHE_FILE = CONFIG_DIR / 'roles_cache.msgpack.gz'
+# Cache files written by earlier versions, removed when the cache is rewritten
+LEGACY_ROLES_CACHE_FILES = (CONFIG_DIR / 'roles_cache.json', CONFIG_DIR / 'roles_cache.json.gz')
+
+# Seconds before cached roles are considered stale and refetched
+ROLES_CACHE_SOFT_TTL = 600
+# Seconds up to which stale roles may still be shown while refreshing in the background
+ROLES_CACHE_HARD_TTL = 86400
 
 # Auto activate config
 AUTO_ACTIVATE_CONFIG = CONFIG_DIR / 'auto_activate.json'
 DEFAULT_IMPORT_CONFIG_FILE = azure_config.parent / 'pim.json'
 
-# Create config directory if it doesn't exist
-CONFIG_DIR.mkdir(exist_ok=True)
+
+def ensure_config_dir():
+    """Create the config directory if it doesn't exist, right before writing to it"""
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
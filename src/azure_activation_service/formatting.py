@@ -0,0 +1,39 @@
+from datetime import datetime, timezone
+
+import click
+
+
+def calculate_expiry(end_date_time, now=None):
+    """Calculate the expiry status of a role relative to now."""
+    if end_date_time:
+        now = now or datetime.now(timezone.utc)
+        if end_date_time < now:
+            return f"Expired {now - end_date_time} ago"
+        else:
+            return f"In {end_date_time - now}"
+    else:
+        return "N/A"
+
+
+def echo_table(rows, headers, table_format="plain"):
+    """Print rows as a table.
+
+    The plain format is aligned with a precomputed template and emitted one
+    line at a time; the grid format is rendered with tabulate.
+    """
+    if table_format == "grid":
+        from tabulate import tabulate
+        click.echo(tabulate(rows, headers=headers, tablefmt="grid"))
+        return
+
+    # Render missing values as empty cells like tabulate does
+    rows = [["" if cell is None else str(cell) for cell in row] for row in rows]
+    widths = [len(h) for h in headers]
+    for row in rows:
+        widths = [max(w, len(cell)) for w, cell in zip(widths, row)]
+    template = "  ".join(f"{{{i}:<{w}}}" for i, w in enumerate(widths))
+
+    click.echo(template.format(*headers).rstrip())
+    click.echo("  ".join("-" * w for w in widths))
+    for row in rows:
+        click.echo(template.format(*row).rstrip())
@@ -1,6 +1,7 @@
+import re
 import requests
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 
@@ -8,6 +9,32 @@ from azure.identity import AzureCliCredential
 from azure.core.exceptions import ClientAuthenticationError
 
 
+def parse_azure_datetime(dt_str: str) -> datetime:
+    """Parse Azure's datetime format which might have single-digit milliseconds."""
+    # Replace 'Z' with '+00:00' for UTC
+    dt_str = dt_str.replace('Z', '+00:00')
+    # Ensure milliseconds have 6 digits (microseconds)
+    if '.' in dt_str:
+        base, ms = dt_str.split('.')
+        ms, tz = ms.split('+')
+        # Pad milliseconds to 6 digits
+        ms = ms.ljust(6, '0')
+        dt_str = f"{base}.{ms}+{tz}"
+    return datetime.fromisoformat(dt_str)
+
+
+_ISO_DURATION_RE = re.compile(
+    r'^P(?:(?P<days>\d+)D)?(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?$')
+
+
+def parse_iso_duration(duration: str) -> Optional[timedelta]:
+    """Parse an ISO 8601 duration such as 'PT8H' as returned by Azure role policies."""
+    match = _ISO_DURATION_RE.match(duration or '')
+    if not match:
+        return None
+    return timedelta(**{k: int(v) for k, v in match.groupdict().items() if v})
+
+
 @dataclass
 class Role:
     """Represents an Azure PIM role."""
@@ -86,10 +113,14 @@ class PIMClient:
 
     AZURE_MGMT_URL = "https://management.azure.com"
     API_VERSION = "2020-10-01"
+    # Activation request statuses after which the role is (about to be) active
+    ACTIVE_REQUEST_STATUSES = ("Provisioned", "Granted", "PendingProvisioning")
 
     def __init__(self):
         """Initialize PIM client using AzureCliCredential."""
         self.credential = AzureCliCredential()
+        # Reuse connections across requests made by this client
+        self.session = requests.Session()
         self._update_token()
 
     def _update_token(self):
@@ -130,7 +161,7 @@ class PIMClient:
             ]
         }
 
-        response = requests.post(
+        response = self.session.post(
             f"{self.AZURE_MGMT_URL}/batch?api-version=2020-06-01",
             headers=self.headers,
             json=batch_request
@@ -139,7 +170,7 @@ class PIMClient:
         if response.status_code == 401:
             # Token might have expired, try to refresh it
             self._update_token()
-            response = requests.post(
+            response = self.session.post(
                 f"{self.AZURE_MGMT_URL}/batch?api-version=2020-06-01",
                 headers=self.headers,
                 json=batch_request
@@ -155,6 +186,12 @@ class PIMClient:
         eligibilities = data['responses'][0]['content']['value']
         assignments = data['responses'][1]['content']['value']
 
+        # Index assignments by their linked eligibility to avoid rescanning them per role
+        assignments_by_eligibility = {}
+        for ra in assignments:
+            assignments_by_eligibility.setdefault(
+                ra['properties'].get('linkedRoleEligibilityScheduleInstanceId'), ra)
+
         for eligibility in eligibilities:
             props = eligibility['properties']
             exp_props = props['expandedProperties']
@@ -172,30 +209,12 @@ class PIMClient:
             )
 
             # Check if role is currently activated
-            role_assignment = next(
-                (ra for ra in assignments
-                 if ra['properties'].get('linkedRoleEligibilityScheduleInstanceId') == role.id),
-                None
-            )
+            role_assignment = assignments_by_eligibility.get(role.id)
 
             if role_assignment:
                 props = role_assignment['properties']
                 role.assignment_name = role_assignment['name']
                 role.assignment_type = props['assignmentType']
-                # Handle Azure's datetime format which might have single-digit milliseconds
-
-                def parse_azure_datetime(dt_str: str) -> datetime:
-                    # Replace 'Z' with '+00:00' for UTC
-                    dt_str = dt_str.replace('Z', '+00:00')
-                    # Ensure milliseconds have 6 digits (microseconds)
-                    if '.' in dt_str:
-                        base, ms = dt_str.split('.')
-                        ms, tz = ms.split('+')
-                        # Pad milliseconds to 6 digits
-                        ms = ms.ljust(6, '0')
-                        dt_str = f"{base}.{ms}+{tz}"
-                    return datetime.fromisoformat(dt_str)
-
                 role.start_date_time = parse_azure_datetime(
                     props['startDateTime'])
                 role.end_date_time = parse_azure_datetime(props['endDateTime'])
@@ -210,7 +229,7 @@ class PIMClient:
             "https://graph.microsoft.com/.default").token
         headers = {"Authorization": f"Bearer {graph_token}"}
 
-        response = requests.get(
+        response = self.session.get(
             "https://graph.microsoft.com/v1.0/me", headers=headers)
 
         if response.status_code != 200:
@@ -236,14 +255,14 @@ class PIMClient:
         # Get user ID and role policy in parallel
         user_id = self._get_user_id()  # Get user ID from Graph API
 
-        policy_response = requests.get(
+        policy_response = self.session.get(
             f"{self.AZURE_MGMT_URL}{role.scope}/providers/Microsoft.Authorization/roleManagementPolicyAssignments?api-version=2020-10-01&$filter=roleDefinitionId eq '{role.role_definition_id}'",
             headers=self.headers
         )
 
         if policy_response.status_code == 401:
             self._update_token()
-            policy_response = requests.get(
+            policy_response = self.session.get(
                 f"{self.AZURE_MGMT_URL}{role.scope}/providers/Microsoft.Authorization/roleManagementPolicyAssignments?api-version=2020-10-01&$filter=roleDefinitionId eq '{role.role_definition_id}'",
                 headers=self.headers
             )
@@ -290,7 +309,7 @@ class PIMClient:
         activation_url = (f"{self.AZURE_MGMT_URL}{role.scope}/providers/Microsoft.Authorization/"
                           f"roleAssignmentScheduleRequests/{str(uuid.uuid4())}?api-version={self.API_VERSION}")
 
-        response = requests.put(
+        response = self.session.put(
             activation_url,
             headers=self.headers,
             json=activation_request
@@ -329,7 +348,7 @@ class PIMClient:
         deactivation_url = (f"{self.AZURE_MGMT_URL}{role.scope}/providers/Microsoft.Authorization/"
                             f"roleAssignmentScheduleRequests/{str(uuid.uuid4())}?api-version={self.API_VERSION}")
 
-        response = requests.put(
+        response = self.session.put(
             deactivation_url,
             headers=self.headers,
             json=deactivation_request
@@ -337,7 +356,7 @@ class PIMClient:
 
         if response.status_code == 401:
             self._update_token()
-            response = requests.put(
+            response = self.session.put(
                 deactivation_url,
                 headers=self.headers,
                 json=deactivation_request
@@ -348,6 +367,42 @@ class PIMClient:
 
         return response.json()
 
+    def apply_activation(self, role: Role, result: Dict[str, Any]) -> None:
+        """
+        Update a role in place from an activation response, so callers can
+        keep their cached roles current without fetching them again. Roles
+        whose request is pending approval, denied or failed are left untouched.
+
+        Args:
+            role: The role that was activated
+            result: Activation response returned by activate_role
+        """
+        props = result.get('properties') or {}
+        if props.get('status') not in self.ACTIVE_REQUEST_STATUSES:
+            return
+
+        schedule = props.get('scheduleInfo') or {}
+        expiration = schedule.get('expiration') or {}
+        start = schedule.get('startDateTime')
+        start_date_time = parse_azure_datetime(start) if start else datetime.now(timezone.utc)
+        if expiration.get('endDateTime'):
+            end_date_time = parse_azure_datetime(expiration['endDateTime'])
+        else:
+            duration = parse_iso_duration(expiration.get('duration'))
+            end_date_time = start_date_time + duration if duration else None
+
+        role.assignment_name = result.get('name')
+        role.assignment_type = 'Activated'
+        role.start_date_time = start_date_time
+        role.end_date_time = end_date_time
+
+    def apply_deactivation(self, role: Role) -> None:
+        """Clear the activation state of a role after it has been deactivated."""
+        role.assignment_name = None
+        role.assignment_type = None
+        role.start_date_time = None
+        role.end_date_time = None
+
     def serialize_roles(self, roles):
         """Convert Role objects to dictionary for caching"""
         return [role.to_dict() for role in roles]
@@ -356,6 +411,10 @@ class PIMClient:
         """Convert cached dictionary back to Role objects"""
         return [Role.from_dict(role_data) for role_data in data]
 
+    def index_roles(self, roles):
+        """Map role names (IDs) to Role objects for constant-time lookup"""
+        return {role.name: role for role in roles}
+
 
 def main():
     """Example usage of the PIMClient."""